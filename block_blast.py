@@ -12,13 +12,44 @@ from __future__ import annotations
 
 import random
 import tkinter as tk
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from time import monotonic
 
 
 BOARD_SIZE = 8
+# (row | col) & OFF_BOARD_BITS is nonzero iff either coordinate is negative or >= BOARD_SIZE.
+# Only valid because BOARD_SIZE is a power of two.
+OFF_BOARD_BITS = ~(BOARD_SIZE - 1)
 CELL_SIZE = 44
 PALETTE_CELL = 18
+PALETTE_GRID = 6
+PREVIEW_FRAME_MS = 16
+# Distinct cells a clear can touch (every row and column at once).
+MAX_CLEAR_CELLS = BOARD_SIZE * BOARD_SIZE
+
+# Bell offsets in ms for each sound; every pattern starts at 0.
+_SOUND_PATTERNS: dict[str, tuple[int, ...]] = {
+    "new_game": (0, 100),
+    "pick": (0,),
+    "place": (0,),
+    "clear": (0, 70),
+    "invalid": (0, 80, 160),
+    "game_over": (0, 120, 240),
+}
+EMPTY_CELL_COLOR = "#57606f"
+
+ALL_CELLS: tuple[tuple[int, int], ...] = tuple((r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE))
+# Canvas (x, y) center of each board cell, indexed by row * BOARD_SIZE + col.
+CELL_CENTERS: tuple[tuple[int, int], ...] = tuple(
+    (c * CELL_SIZE + CELL_SIZE // 2, r * CELL_SIZE + CELL_SIZE // 2) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE)
+)
+
+# Board occupancy is a 64-bit int: bit ``row * BOARD_SIZE + col`` is set when the cell is filled.
+ROW_MASKS: tuple[int, ...] = tuple(0xFF << (r * BOARD_SIZE) for r in range(BOARD_SIZE))
+COL_MASKS: tuple[int, ...] = tuple(0x0101010101010101 << c for c in range(BOARD_SIZE))
+# Inner 4x4 block. has_any_valid_move tries anchors that overlap it least (edges, corners) first.
+CENTER_MASK = sum(0x3C << (r * BOARD_SIZE) for r in range(2, 6))
 
 
 @dataclass(frozen=True)
@@ -26,21 +57,65 @@ class Piece:
     name: str
     cells: tuple[tuple[int, int], ...]
     color: str
+    # 1-based position in PIECES and this piece's entry in COLOR_TABLE; 0 is reserved for empty cells.
+    index: int = field(repr=False, compare=False)
+    dxs: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    dys: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    size: int = field(init=False, repr=False, compare=False)
+    # Top-left corner of each cell on a palette canvas, with the piece already centered.
+    palette_rects: tuple[tuple[int, int], ...] = field(init=False, repr=False, compare=False)
+    # Packed ``row * BOARD_SIZE + col`` anchors where the piece fits on the board, and their occupancy masks.
+    anchors: frozenset[int] = field(init=False, repr=False, compare=False)
+    mask_at: dict[int, int] = field(init=False, repr=False, compare=False)
+    anchor_masks: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        dxs = tuple(dx for dx, _ in self.cells)
+        dys = tuple(dy for _, dy in self.cells)
+        object.__setattr__(self, "dxs", dxs)
+        object.__setattr__(self, "dys", dys)
+        object.__setattr__(self, "size", len(self.cells))
+
+        min_x, min_y, max_x, max_y = min(dxs), min(dys), max(dxs), max(dys)
+        offset_x = (PALETTE_GRID - (max_x - min_x + 1)) * PALETTE_CELL // 2
+        offset_y = (PALETTE_GRID - (max_y - min_y + 1)) * PALETTE_CELL // 2
+        palette_rects = tuple(
+            (offset_x + (dxs[i] - min_x) * PALETTE_CELL, offset_y + (dys[i] - min_y) * PALETTE_CELL) for i in range(len(dxs))
+        )
+        object.__setattr__(self, "palette_rects", palette_rects)
+
+        mask_at: dict[int, int] = {}
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                mask = 0
+                for i in range(len(dxs)):
+                    r = row + dys[i]
+                    c = col + dxs[i]
+                    if (r | c) & OFF_BOARD_BITS:
+                        break
+                    mask |= 1 << (r * BOARD_SIZE + c)
+                else:
+                    mask_at[row * BOARD_SIZE + col] = mask
+        object.__setattr__(self, "anchors", frozenset(mask_at))
+        object.__setattr__(self, "mask_at", mask_at)
+        object.__setattr__(self, "anchor_masks", tuple(sorted(mask_at.values(), key=lambda m: (m & CENTER_MASK).bit_count())))
 
 
 PIECES: tuple[Piece, ...] = (
-    Piece("Dot", ((0, 0),), "#ff6b6b"),
-    Piece("Line2", ((0, 0), (1, 0)), "#4ecdc4"),
-    Piece("Line3", ((0, 0), (1, 0), (2, 0)), "#1a535c"),
-    Piece("Line4", ((0, 0), (1, 0), (2, 0), (3, 0)), "#ff9f1c"),
-    Piece("Tall2", ((0, 0), (0, 1)), "#7b2cbf"),
-    Piece("Tall3", ((0, 0), (0, 1), (0, 2)), "#3a86ff"),
-    Piece("Square2", ((0, 0), (1, 0), (0, 1), (1, 1)), "#06d6a0"),
-    Piece("L3", ((0, 0), (0, 1), (1, 1)), "#f15bb5"),
-    Piece("L4", ((0, 0), (0, 1), (0, 2), (1, 2)), "#9b5de5"),
-    Piece("T4", ((0, 0), (1, 0), (2, 0), (1, 1)), "#e76f51"),
-    Piece("Z4", ((0, 0), (1, 0), (1, 1), (2, 1)), "#2a9d8f"),
+    Piece("Dot", ((0, 0),), "#ff6b6b", 1),
+    Piece("Line2", ((0, 0), (1, 0)), "#4ecdc4", 2),
+    Piece("Line3", ((0, 0), (1, 0), (2, 0)), "#1a535c", 3),
+    Piece("Line4", ((0, 0), (1, 0), (2, 0), (3, 0)), "#ff9f1c", 4),
+    Piece("Tall2", ((0, 0), (0, 1)), "#7b2cbf", 5),
+    Piece("Tall3", ((0, 0), (0, 1), (0, 2)), "#3a86ff", 6),
+    Piece("Square2", ((0, 0), (1, 0), (0, 1), (1, 1)), "#06d6a0", 7),
+    Piece("L3", ((0, 0), (0, 1), (1, 1)), "#f15bb5", 8),
+    Piece("L4", ((0, 0), (0, 1), (0, 2), (1, 2)), "#9b5de5", 9),
+    Piece("T4", ((0, 0), (1, 0), (2, 0), (1, 1)), "#e76f51", 10),
+    Piece("Z4", ((0, 0), (1, 0), (1, 1), (2, 1)), "#2a9d8f", 11),
 )
+MAX_PIECE_CELLS = max(piece.size for piece in PIECES)
+COLOR_TABLE: tuple[str, ...] = (EMPTY_CELL_COLOR, *(piece.color for piece in PIECES))
 
 
 class BlockBlastGame:
@@ -49,16 +124,23 @@ class BlockBlastGame:
         self.root.title("Block Blast (tkinter)")
         self.root.configure(bg="#1f2430")
 
-        self.board = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        self.occ = 0
+        self.cell_color_idx = bytearray(BOARD_SIZE * BOARD_SIZE)
+        # Pending UI work, flushed once per handler by _commit_ui().
+        self._dirty_cells: set[tuple[int, int]] = set()
+        self._needs_palette_redraw = False
         self.selected_piece_index: int | None = None
         self.dragging_piece_index: int | None = None
         self.dragging_piece: Piece | None = None
+        self._preview_pending = False
+        self._preview_xy = (0, 0)
         self.score = 0
         self.high_score = 0
         self.clear_effect_job: str | None = None
         self.clear_effect_frame = 0
-        self.clear_effect_rows: list[int] = []
-        self.clear_effect_cols: list[int] = []
+        self.clear_effect_frames = 0
+        self.clear_effect_centers: list[tuple[int, int]] = []
+        self.spark_items: list[int] = []
 
         outer = tk.Frame(self.root, bg="#1f2430", padx=10, pady=10)
         outer.pack()
@@ -72,6 +154,32 @@ class BlockBlastGame:
         )
         self.board_canvas.grid(row=0, column=0, rowspan=2)
         self.board_canvas.bind("<Button-1>", self.on_board_click)
+        # Screen position of the board, refreshed when the board is resized and at the start of each drag.
+        self._board_root_x = 0
+        self._board_root_y = 0
+        self.board_canvas.bind("<Configure>", self._cache_board_origin)
+
+        # Board cells are created once and recolored in place; see update_cells().
+        self.cell_items: list[list[int]] = [
+            [
+                self.board_canvas.create_rectangle(
+                    c * CELL_SIZE + 1,
+                    r * CELL_SIZE + 1,
+                    (c + 1) * CELL_SIZE - 1,
+                    (r + 1) * CELL_SIZE - 1,
+                    fill=EMPTY_CELL_COLOR,
+                    outline="#2f3542",
+                )
+                for c in range(BOARD_SIZE)
+            ]
+            for r in range(BOARD_SIZE)
+        ]
+        # Color index each cell item was last configured with; cells start out empty.
+        self.cell_current_color = bytearray(BOARD_SIZE * BOARD_SIZE)
+        self.preview_items: list[int] = [
+            self.board_canvas.create_rectangle(0, 0, 0, 0, width=2, stipple="gray50", state="hidden", tags="drag_preview")
+            for _ in range(MAX_PIECE_CELLS)
+        ]
 
         panel = tk.Frame(outer, bg="#1f2430", padx=12)
         panel.grid(row=0, column=1, sticky="n")
@@ -86,10 +194,13 @@ class BlockBlastGame:
         tk.Label(panel, text=help_text, fg="#ced6e0", bg="#1f2430", justify="left").pack(anchor="w", pady=(0, 10))
 
         self.piece_canvases: list[tk.Canvas] = []
+        self.palette_items: list[list[int]] = []
         for idx in range(3):
-            c = tk.Canvas(panel, width=6 * PALETTE_CELL, height=6 * PALETTE_CELL, bg="#2f3542", highlightthickness=2)
+            c = tk.Canvas(panel, width=PALETTE_GRID * PALETTE_CELL, height=PALETTE_GRID * PALETTE_CELL, bg="#2f3542", highlightthickness=2)
             c.pack(pady=6)
-            c.bind("<Button-1>", lambda _evt, i=idx: self.select_piece(i))
+            self.palette_items.append([c.create_rectangle(0, 0, 0, 0, outline="#2f3542", state="hidden") for _ in range(MAX_PIECE_CELLS)])
+            # <Button-1> and <ButtonPress-1> are the same event; start_drag also selects the piece,
+            # so a plain click still works for click-then-board placement.
             c.bind("<ButtonPress-1>", lambda _evt, i=idx: self.start_drag(i))
             self.piece_canvases.append(c)
 
@@ -102,29 +213,22 @@ class BlockBlastGame:
         self.new_game()
 
     def new_game(self) -> None:
-        if self.bomb_job is not None:
-            self.root.after_cancel(self.bomb_job)
-            self.bomb_job = None
-        self.board = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        self.occ = 0
+        self.cell_color_idx = bytearray(BOARD_SIZE * BOARD_SIZE)
         self.score = 0
         self.selected_piece_index = None
         self.stop_drag()
         self.message_label.config(text="")
         self.refresh_offered_pieces()
-        self.redraw_board()
+        self._dirty_cells.update(ALL_CELLS)
         self.update_score_labels()
         self.play_sound("new_game")
+        self._commit_ui()
 
     def refresh_offered_pieces(self) -> None:
-        self.offered_pieces = [random.choice(PIECES) for _ in range(3)]
+        self.offered_pieces = list(random.choices(PIECES, k=3))
         self.selected_piece_index = None
-        self.redraw_piece_palette()
-
-    def select_piece(self, index: int) -> None:
-        if self.offered_pieces[index] is None:
-            return
-        self.selected_piece_index = index
-        self.redraw_piece_palette()
+        self._needs_palette_redraw = True
 
     def start_drag(self, index: int) -> None:
         piece = self.offered_pieces[index]
@@ -133,44 +237,61 @@ class BlockBlastGame:
         self.dragging_piece_index = index
         self.dragging_piece = piece
         self.selected_piece_index = index
+        self._cache_board_origin()
+        self.board_canvas.tag_raise("drag_preview")
         self.play_sound("pick")
         self.root.bind_all("<Motion>", self.on_global_motion)
         self.root.bind_all("<ButtonRelease-1>", self.on_global_release)
-        self.redraw_piece_palette()
+        self._needs_palette_redraw = True
+        self._commit_ui()
         self.update_drag_preview(*self.root.winfo_pointerxy())
 
     def stop_drag(self) -> None:
         self.dragging_piece_index = None
         self.dragging_piece = None
-        self.board_canvas.delete("drag_preview")
+        self.board_canvas.itemconfigure("drag_preview", state="hidden")
         self.root.unbind_all("<Motion>")
         self.root.unbind_all("<ButtonRelease-1>")
 
-    def on_global_motion(self, _event: tk.Event) -> None:
+    def on_global_motion(self, event: tk.Event) -> None:
         if self.dragging_piece is None:
             return
-        self.update_drag_preview(*self.root.winfo_pointerxy())
+        # Only remember the latest pointer position; the preview is redrawn at most once per frame.
+        self._preview_xy = (event.x_root, event.y_root)
+        if not self._preview_pending:
+            self._preview_pending = True
+            self.root.after(PREVIEW_FRAME_MS, self._flush_preview)
+
+    def _flush_preview(self) -> None:
+        self._preview_pending = False
+        self.update_drag_preview(*self._preview_xy)
 
     def on_global_release(self, _event: tk.Event) -> None:
         if self.dragging_piece is None or self.dragging_piece_index is None:
             return
 
         row, col = self.pointer_to_board_cell(*self.root.winfo_pointerxy())
-        if row is not None and col is not None and self.can_place_piece(self.dragging_piece, row, col):
-            self.place_selected_piece(self.dragging_piece_index, row, col)
-        else:
-            self.play_sound("invalid")
+        # Releasing off the board (e.g. a plain click on the palette) just leaves the piece selected.
+        if row is not None and col is not None:
+            if self.can_place_piece(self.dragging_piece, row, col):
+                self.place_selected_piece(self.dragging_piece_index, row, col)
+            else:
+                self.play_sound("invalid")
 
         self.stop_drag()
-        self.redraw_piece_palette()
-        self.redraw_board()
+        self._needs_palette_redraw = True
+        self._commit_ui()
+
+    def _cache_board_origin(self, _event: tk.Event | None = None) -> None:
+        self._board_root_x = self.board_canvas.winfo_rootx()
+        self._board_root_y = self.board_canvas.winfo_rooty()
 
     def pointer_to_board_cell(self, pointer_x: int, pointer_y: int) -> tuple[int | None, int | None]:
-        board_x = pointer_x - self.board_canvas.winfo_rootx()
-        board_y = pointer_y - self.board_canvas.winfo_rooty()
+        board_x = pointer_x - self._board_root_x
+        board_y = pointer_y - self._board_root_y
         col = board_x // CELL_SIZE
         row = board_y // CELL_SIZE
-        if not (0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
+        if (row | col) & OFF_BOARD_BITS:
             return None, None
         return row, col
 
@@ -178,75 +299,41 @@ class BlockBlastGame:
         if self.dragging_piece is None:
             return
 
-        self.board_canvas.delete("drag_preview")
         row, col = self.pointer_to_board_cell(pointer_x, pointer_y)
         if row is None or col is None:
+            self.board_canvas.itemconfigure("drag_preview", state="hidden")
             return
 
         valid = self.can_place_piece(self.dragging_piece, row, col)
         border = "#7bed9f" if valid else "#ff6b81"
         fill = "#7bed9f" if valid else "#ff4757"
 
-        for dx, dy in self.dragging_piece.cells:
-            r = row + dy
-            c = col + dx
-            if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
+        used = 0
+        dxs, dys = self.dragging_piece.dxs, self.dragging_piece.dys
+        for i in range(len(dxs)):
+            r = row + dys[i]
+            c = col + dxs[i]
+            if (r | c) & OFF_BOARD_BITS:
                 continue
             x1, y1 = c * CELL_SIZE, r * CELL_SIZE
             x2, y2 = x1 + CELL_SIZE, y1 + CELL_SIZE
-            self.board_canvas.create_rectangle(
-                x1 + 2,
-                y1 + 2,
-                x2 - 2,
-                y2 - 2,
-                fill=fill,
-                outline=border,
-                width=2,
-                stipple="gray50",
-                tags="drag_preview",
-            )
+            item = self.preview_items[used]
+            self.board_canvas.coords(item, x1 + 2, y1 + 2, x2 - 2, y2 - 2)
+            self.board_canvas.itemconfigure(item, fill=fill, outline=border, state="normal")
+            used += 1
 
-    def on_board_click(self, event: tk.Event) -> None:
-        if self.selected_piece_index is None:
-            return
-        row = event.y // CELL_SIZE
-        col = event.x // CELL_SIZE
-        self.place_selected_piece(self.selected_piece_index, row, col)
-
-    def place_selected_piece(self, piece_index: int, row: int, col: int) -> bool:
-        piece = self.offered_pieces[piece_index]
-        if piece is None:
-            return False
-
-        valid = self.can_place_piece(self.dragging_piece, row, col)
-        border = "#7bed9f" if valid else "#ff6b81"
-        fill = "#7bed9f" if valid else "#ff4757"
-
-        for dx, dy in self.dragging_piece.cells:
-            r = row + dy
-            c = col + dx
-            if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
-                continue
-            x1, y1 = c * CELL_SIZE, r * CELL_SIZE
-            x2, y2 = x1 + CELL_SIZE, y1 + CELL_SIZE
-            self.board_canvas.create_rectangle(
-                x1 + 2,
-                y1 + 2,
-                x2 - 2,
-                y2 - 2,
-                fill=fill,
-                outline=border,
-                width=2,
-                stipple="gray50",
-                tags="drag_preview",
-            )
+        for item in self.preview_items[used:]:
+            self.board_canvas.itemconfigure(item, state="hidden")
 
     def on_board_click(self, event: tk.Event) -> None:
         if self.selected_piece_index is None:
             return
         row = event.y // CELL_SIZE
         col = event.x // CELL_SIZE
+        if (row | col) & OFF_BOARD_BITS:
+            return
         self.place_selected_piece(self.selected_piece_index, row, col)
+        self._commit_ui()
 
     def place_selected_piece(self, piece_index: int, row: int, col: int) -> bool:
         piece = self.offered_pieces[piece_index]
@@ -262,7 +349,7 @@ class BlockBlastGame:
         self.offered_pieces[piece_index] = None
         self.selected_piece_index = None
 
-        gained = len(piece.cells)
+        gained = piece.size
         cleared_rows, cleared_cols = self.clear_lines()
         cleared = len(cleared_rows) + len(cleared_cols)
         if cleared:
@@ -273,13 +360,11 @@ class BlockBlastGame:
         self.score += gained
         self.high_score = max(self.high_score, self.score)
         self.update_score_labels()
-        self.maybe_defuse_bomb()
 
         if all(p is None for p in self.offered_pieces):
             self.refresh_offered_pieces()
 
-        self.redraw_piece_palette()
-        self.redraw_board()
+        self._needs_palette_redraw = True
 
         if not self.has_any_valid_move():
             self.flash_message("Game over! Press New Game.")
@@ -288,135 +373,143 @@ class BlockBlastGame:
         return True
 
     def can_place_piece(self, piece: Piece, base_row: int, base_col: int) -> bool:
-        for dx, dy in piece.cells:
-            r = base_row + dy
-            c = base_col + dx
-            if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
-                return False
-            if self.board[r][c]:
-                return False
-        return True
+        anchor = base_row * BOARD_SIZE + base_col
+        return anchor in piece.anchors and not (self.occ & piece.mask_at[anchor])
 
     def place_piece(self, piece: Piece, base_row: int, base_col: int) -> None:
-        for dx, dy in piece.cells:
-            self.board[base_row + dy][base_col + dx] = piece.color
+        self.occ |= piece.mask_at[base_row * BOARD_SIZE + base_col]
+        dxs, dys = piece.dxs, piece.dys
+        for i in range(len(dxs)):
+            r = base_row + dys[i]
+            c = base_col + dxs[i]
+            self.cell_color_idx[r * BOARD_SIZE + c] = piece.index
+            self._dirty_cells.add((r, c))
 
     def clear_lines(self) -> tuple[list[int], list[int]]:
-        full_rows = [r for r in range(BOARD_SIZE) if all(self.board[r][c] for c in range(BOARD_SIZE))]
-        full_cols = [c for c in range(BOARD_SIZE) if all(self.board[r][c] for r in range(BOARD_SIZE))]
-
-        for r in full_rows:
-            for c in range(BOARD_SIZE):
-                self.board[r][c] = 0
-
-        for c in full_cols:
-            for r in range(BOARD_SIZE):
-                self.board[r][c] = 0
+        occ = self.occ
+        full_rows: list[int] = []
+        full_cols: list[int] = []
+        clear_mask = 0
+        for i in range(BOARD_SIZE):
+            row_mask = ROW_MASKS[i]
+            if (occ & row_mask) == row_mask:
+                full_rows.append(i)
+                clear_mask |= row_mask
+            col_mask = COL_MASKS[i]
+            if (occ & col_mask) == col_mask:
+                full_cols.append(i)
+                clear_mask |= col_mask
+
+        if clear_mask:
+            self.occ = occ & ~clear_mask
+            for r in full_rows:
+                self.cell_color_idx[r * BOARD_SIZE : (r + 1) * BOARD_SIZE] = bytes(BOARD_SIZE)
+                self._dirty_cells.update((r, c) for c in range(BOARD_SIZE))
+            for c in full_cols:
+                self.cell_color_idx[c::BOARD_SIZE] = bytes(BOARD_SIZE)
+                self._dirty_cells.update((r, c) for r in range(BOARD_SIZE))
 
         return full_rows, full_cols
 
     def start_clear_effect(self, rows: list[int], cols: list[int]) -> None:
-        self.clear_effect_rows = rows
-        self.clear_effect_cols = cols
+        if not rows and not cols:
+            return
+        # Cells at a row/column intersection get a single sparkle.
+        cells = {r * BOARD_SIZE + c for r in rows for c in range(BOARD_SIZE)}
+        cells.update(r * BOARD_SIZE + c for c in cols for r in range(BOARD_SIZE))
+        self.clear_effect_centers = [CELL_CENTERS[index] for index in sorted(cells)]
         self.clear_effect_frame = 0
+        # Bigger clears get a longer effect: 3 frames for a single line, up to 6.
+        self.clear_effect_frames = min(6, max(3, 2 + len(rows) + len(cols)))
         if self.clear_effect_job is not None:
             self.root.after_cancel(self.clear_effect_job)
-        self.animate_clear_effect()
+        self.board_canvas.delete("clear_effect")
 
-    def animate_clear_effect(self) -> None:
-        self.redraw_board()
-        flash_colors = ("#fff08a", "#ffd32a", "#7bed9f")
-        color = flash_colors[self.clear_effect_frame % len(flash_colors)]
-
-        for row in self.clear_effect_rows:
+        # The stripes stay put for the whole effect; each frame only recolors them.
+        for row in rows:
             y1 = row * CELL_SIZE + 4
             y2 = (row + 1) * CELL_SIZE - 4
-            self.board_canvas.create_rectangle(0, y1, BOARD_SIZE * CELL_SIZE, y2, fill=color, outline="", stipple="gray50")
+            self.board_canvas.create_rectangle(0, y1, BOARD_SIZE * CELL_SIZE, y2, outline="", stipple="gray50", tags=("clear_effect", "clear_stripe"))
 
-        for col in self.clear_effect_cols:
+        for col in cols:
             x1 = col * CELL_SIZE + 4
             x2 = (col + 1) * CELL_SIZE - 4
-            self.board_canvas.create_rectangle(x1, 0, x2, BOARD_SIZE * CELL_SIZE, fill=color, outline="", stipple="gray50")
+            self.board_canvas.create_rectangle(x1, 0, x2, BOARD_SIZE * CELL_SIZE, outline="", stipple="gray50", tags=("clear_effect", "clear_stripe"))
+
+        if not self.spark_items:
+            self.spark_items = [
+                self.board_canvas.create_oval(0, 0, 0, 0, outline="#fefefe", width=2, state="hidden", tags="clear_spark")
+                for _ in range(MAX_CLEAR_CELLS)
+            ]
+        self.board_canvas.tag_raise("clear_spark")
+        self.board_canvas.itemconfigure("clear_spark", state="hidden")
+        for item in self.spark_items[: len(self.clear_effect_centers)]:
+            self.board_canvas.itemconfigure(item, state="normal")
 
-        spark_radius = 4 + self.clear_effect_frame * 2
-        for row in self.clear_effect_rows:
-            for col in range(BOARD_SIZE):
-                cx = col * CELL_SIZE + CELL_SIZE // 2
-                cy = row * CELL_SIZE + CELL_SIZE // 2
-                self.board_canvas.create_oval(
-                    cx - spark_radius,
-                    cy - spark_radius,
-                    cx + spark_radius,
-                    cy + spark_radius,
-                    outline="#fefefe",
-                    width=2,
-                )
+        self.animate_clear_effect()
 
-        for col in self.clear_effect_cols:
-            for row in range(BOARD_SIZE):
-                cx = col * CELL_SIZE + CELL_SIZE // 2
-                cy = row * CELL_SIZE + CELL_SIZE // 2
-                self.board_canvas.create_oval(
-                    cx - spark_radius,
-                    cy - spark_radius,
-                    cx + spark_radius,
-                    cy + spark_radius,
-                    outline="#fefefe",
-                    width=2,
-                )
+    def animate_clear_effect(self) -> None:
+        flash_colors = ("#fff08a", "#ffd32a", "#7bed9f")
+        self.board_canvas.itemconfigure("clear_stripe", fill=flash_colors[self.clear_effect_frame % len(flash_colors)])
+
+        spark_radius = 4 + self.clear_effect_frame * 2
+        for item, (cx, cy) in zip(self.spark_items, self.clear_effect_centers):
+            self.board_canvas.coords(item, cx - spark_radius, cy - spark_radius, cx + spark_radius, cy + spark_radius)
 
         self.clear_effect_frame += 1
-        if self.clear_effect_frame < 6:
+        if self.clear_effect_frame < self.clear_effect_frames:
             self.clear_effect_job = self.root.after(65, self.animate_clear_effect)
         else:
             self.clear_effect_job = None
-            self.redraw_board()
+            self.board_canvas.delete("clear_effect")
+            self.board_canvas.itemconfigure("clear_spark", state="hidden")
 
     def has_any_valid_move(self) -> bool:
         active_pieces = [p for p in self.offered_pieces if p is not None]
         if not active_pieces:
             return True
 
-        for piece in active_pieces:
-            for row in range(BOARD_SIZE):
-                for col in range(BOARD_SIZE):
-                    if self.can_place_piece(piece, row, col):
-                        return True
-        return False
-
-    def redraw_board(self) -> None:
-        self.board_canvas.delete("all")
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                x1, y1 = c * CELL_SIZE, r * CELL_SIZE
-                x2, y2 = x1 + CELL_SIZE, y1 + CELL_SIZE
-                fill = self.board[r][c] if self.board[r][c] else "#57606f"
-                self.board_canvas.create_rectangle(x1 + 1, y1 + 1, x2 - 1, y2 - 1, fill=fill, outline="#2f3542")
+        occ = self.occ
+        return any(not (occ & mask) for piece in active_pieces for mask in piece.anchor_masks)
+
+    def update_cells(self, changed: Iterable[tuple[int, int]]) -> None:
+        for r, c in changed:
+            index = r * BOARD_SIZE + c
+            color_idx = self.cell_color_idx[index]
+            if color_idx == self.cell_current_color[index]:
+                continue
+            self.cell_current_color[index] = color_idx
+            self.board_canvas.itemconfigure(self.cell_items[r][c], fill=COLOR_TABLE[color_idx])
+
+    def _commit_ui(self) -> None:
+        if self._dirty_cells:
+            self.update_cells(self._dirty_cells)
+            self._dirty_cells.clear()
+        if self._needs_palette_redraw:
+            self._needs_palette_redraw = False
+            self.redraw_piece_palette()
 
     def redraw_piece_palette(self) -> None:
         for idx, canvas in enumerate(self.piece_canvases):
-            canvas.delete("all")
+            items = self.palette_items[idx]
             piece = self.offered_pieces[idx]
             if piece is None:
                 canvas.configure(highlightbackground="#57606f")
+                for item in items:
+                    canvas.itemconfigure(item, state="hidden")
                 continue
 
             is_selected = idx == self.selected_piece_index
             canvas.configure(highlightbackground="#ffd32a" if is_selected else "#57606f")
 
-            min_x = min(x for x, _ in piece.cells)
-            min_y = min(y for _, y in piece.cells)
-            max_x = max(x for x, _ in piece.cells)
-            max_y = max(y for _, y in piece.cells)
-            w_cells, h_cells = max_x - min_x + 1, max_y - min_y + 1
-
-            offset_x = (6 - w_cells) * PALETTE_CELL // 2
-            offset_y = (6 - h_cells) * PALETTE_CELL // 2
-
-            for x, y in piece.cells:
-                px = offset_x + (x - min_x) * PALETTE_CELL
-                py = offset_y + (y - min_y) * PALETTE_CELL
-                canvas.create_rectangle(px + 1, py + 1, px + PALETTE_CELL - 1, py + PALETTE_CELL - 1, fill=piece.color, outline="#2f3542")
+            rects = piece.palette_rects
+            for i, item in enumerate(items):
+                if i < len(rects):
+                    px, py = rects[i]
+                    canvas.coords(item, px + 1, py + 1, px + PALETTE_CELL - 1, py + PALETTE_CELL - 1)
+                    canvas.itemconfigure(item, fill=piece.color, state="normal")
+                else:
+                    canvas.itemconfigure(item, state="hidden")
 
     def update_score_labels(self) -> None:
         self.score_label.config(text=f"Score: {self.score}")
@@ -426,16 +519,13 @@ class BlockBlastGame:
         self.message_label.config(text=text)
 
     def play_sound(self, kind: str) -> None:
-        patterns = {
-            "new_game": (0, 100),
-            "pick": (0,),
-            "place": (0,),
-            "clear": (0, 70),
-            "invalid": (0, 80, 160),
-            "game_over": (0, 120, 240),
-        }
-        for delay in patterns.get(kind, (0,)):
-            self.root.after(delay, self.root.bell)
+        self.root.after_idle(self._beep_pattern, _SOUND_PATTERNS.get(kind, (0,)))
+
+    def _beep_pattern(self, pattern: tuple[int, ...], step: int = 0) -> None:
+        # Each beep schedules the next one, relative to its own offset.
+        self.root.bell()
+        if step + 1 < len(pattern):
+            self.root.after(pattern[step + 1] - pattern[step], self._beep_pattern, pattern, step + 1)
 
 
 def main() -> None: